@@ -43,7 +43,14 @@ from .modules.ai import explain_model_cli
 from .modules.search import search_cli_sync
 from .modules.remove import remove_models_cli
 
-from .modules.create import create_image_cli, fetch_job_details, cancel_job
+from .modules.create import (
+    MAX_IMAGE_SIDE,
+    SchedulerChoice,
+    parse_image_size,
+    create_image_cli,
+    fetch_job_details,
+    cancel_job,
+)
 
 from rich.traceback import install
 
@@ -206,23 +213,50 @@ def sanity_check_command():
     )
 
 
+def validate_image_size(size: Optional[str]) -> Optional[str]:
+    if size is not None and not parse_image_size(size):
+        raise typer.BadParameter(
+            f"Use WIDTHxHEIGHT with sides up to {MAX_IMAGE_SIDE}, e.g. 1024x1024."
+        )
+    return size
+
+
 @create_group.command("image", help="Generate an image on the CivitAI platform.")
 def create_image_command(
     model: int = typer.Argument(..., help="The ID of the model"),
     lora: List[int] = typer.Option([], help="The IDs of the Lora models"),
+    scheduler: Optional[SchedulerChoice] = typer.Option(
+        None, help="Scheduler to use"
+    ),
+    steps: Optional[int] = typer.Option(None, min=1, help="Number of sampling steps"),
+    cfg_scale: Optional[float] = typer.Option(None, min=0, help="CFG scale"),
+    size: Optional[str] = typer.Option(
+        None,
+        callback=validate_image_size,
+        help="Image size as WIDTHxHEIGHT, e.g. 1024x1024",
+    ),
 ):
     """
     Generate an image on the CivitAI platform.
     """
     try:
-        create_image_cli(CIVITAI_MODELS, CIVITAI_VERSIONS, model, lora or [])
+        create_image_cli(
+            CIVITAI_MODELS,
+            CIVITAI_VERSIONS,
+            model,
+            lora or [],
+            scheduler=scheduler.value if scheduler else None,
+            steps=steps,
+            cfg_scale=cfg_scale,
+            size=size,
+        )
     except Exception as e:
         feedback_message(f"Error generating image: {str(e)}", "error")
 
 
 @create_group.command("check-jobs", help="Fetch job details based on Job ID.")
 def fetch_job_command(
-    job_id: str = typer.Argument(..., help="Job ID to fetch details for"),
+    job_id: Optional[str] = typer.Argument(None, help="Job ID to fetch details for"),
     user_id: str = typer.Option(None, help="User ID to query jobs for"),
     detailed: bool = typer.Option(False, help="Get detailed job information"),
 ):
@@ -230,11 +264,7 @@ def fetch_job_command(
     Fetch job details based on Job ID or query jobs.
     """
     try:
-        job_details = fetch_job_details(job_id, user_id, detailed)
-        if job_details:
-            typer.echo(job_details)
-        else:
-            feedback_message("No job details found.", "warning")
+        fetch_job_details(job_id, user_id, detailed)
     except Exception as e:
         feedback_message(f"Error fetching job details: {str(e)}", "error")
 
@@ -0,0 +1,112 @@
+import sqlite3
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Final, Iterator, Optional, Tuple
+
+from .helpers import json_dumps, json_loads
+
+__all__ = ["cached_fetch", "open_cache", "read_cache", "write_cache"]
+
+CACHE_DB: Final[Path] = Path("~/.civitai-cli/cache.db").expanduser()
+
+
+def _connect() -> Optional[sqlite3.Connection]:
+    try:
+        CACHE_DB.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(CACHE_DB, isolation_level=None, timeout=5)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, payload BLOB NOT NULL, fetched_at INTEGER NOT NULL)"
+        )
+        return conn
+    except (OSError, sqlite3.Error):
+        return None
+
+
+@contextmanager
+def open_cache() -> Iterator[Optional[sqlite3.Connection]]:
+    """
+    Open the cache database for one operation.
+
+    Yields None if the database cannot be opened; read_cache and write_cache
+    then behave as a permanent miss and a no-op.
+    """
+    conn = _connect()
+    try:
+        yield conn
+    finally:
+        if conn is not None:
+            conn.close()
+
+
+def _read_entry(
+    conn: Optional[sqlite3.Connection], key: str
+) -> Tuple[Optional[Any], int]:
+    if conn is None:
+        return None, 0
+    try:
+        row = conn.execute(
+            "SELECT payload, fetched_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        return (json_loads(row[0]), row[1]) if row else (None, 0)
+    except (sqlite3.Error, ValueError):
+        return None, 0
+
+
+def _is_fresh(fetched_at: int, ttl: Optional[int]) -> bool:
+    return ttl is None or time.time() - fetched_at < ttl
+
+
+def read_cache(
+    conn: Optional[sqlite3.Connection], key: str, ttl: Optional[int] = None
+) -> Optional[Any]:
+    """
+    Return the cached entry for key if it exists and is still fresh.
+
+    :param conn: Connection from open_cache.
+    :param key: Cache key, e.g. "model:https://civitai.com/api/v1/models/1234".
+    :param ttl: Seconds an entry stays fresh, or None for entries that never expire.
+    """
+    cached, fetched_at = _read_entry(conn, key)
+    return cached if cached is not None and _is_fresh(fetched_at, ttl) else None
+
+
+def write_cache(conn: Optional[sqlite3.Connection], key: str, data: Any) -> None:
+    """Store data under key, replacing any existing entry."""
+    if conn is None:
+        return
+    try:
+        conn.execute(
+            "INSERT OR REPLACE INTO responses (key, payload, fetched_at) "
+            "VALUES (?, ?, ?)",
+            (key, json_dumps(data), int(time.time())),
+        )
+    except (sqlite3.Error, TypeError):
+        pass
+
+
+def cached_fetch(
+    key: str, ttl: Optional[int], fetcher: Callable[[], Optional[Any]]
+) -> Optional[Any]:
+    """
+    Return the cached response for key, calling fetcher on a miss.
+
+    :param key: Cache key, e.g. "model:https://civitai.com/api/v1/models/1234".
+    :param ttl: Seconds an entry stays fresh, or None for entries that never expire.
+    :param fetcher: Performs the live request; falsy results are not stored.
+    :return: The cached or freshly fetched data. A stale entry is still
+             returned if the refresh comes back empty.
+    """
+    with open_cache() as conn:
+        cached, fetched_at = _read_entry(conn, key)
+        if cached is not None and _is_fresh(fetched_at, ttl):
+            return cached
+
+        data = fetcher()
+        if not data:
+            return cached if cached is not None else data
+
+        write_cache(conn, key, data)
+        return data
@@ -1,23 +1,33 @@
 import os
 import random
+import re
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Dict, List, Final, Optional
-from questionary import select
+from typing import Dict, FrozenSet, Iterator, List, Final, Optional, Tuple
+from questionary import Choice, select
 from questionary import text as prompt
 
-from rich import print_json
 from rich.console import Console
 import typer
 
-from civitai_models_manager.modules.helpers import feedback_message
-from .details import get_model_details, process_model_data
+from civitai_models_manager.modules.helpers import (
+    feedback_message,
+    create_table,
+    json_dumps,
+)
+from .details import get_model_details, get_models_bulk
 
+# The civitai SDK reads its token at import time; it is imported lazily
+# inside the functions that need it to keep CLI startup light
 os.environ["CIVITAI_API_TOKEN"] = os.getenv("CIVITAI_TOKEN")
-import civitai
 
 console = Console()
 
-SCHEDULERS: Final[List[str]] = [
+# Keep concurrent LoRA lookups modest to avoid hammering the Civitai API
+LORA_FETCH_WORKERS: Final[int] = 8
+
+SCHEDULERS: Final[Tuple[str, ...]] = (
     "EulerA",
     "Euler",
     "LMS",
@@ -42,9 +52,27 @@ SCHEDULERS: Final[List[str]] = [
     "LCM",
     "DDPM",
     "DEIS",
+)
+SCHEDULERS_SET: Final[FrozenSet[str]] = frozenset(SCHEDULERS)
+# Lets typer validate --scheduler against the same names
+SchedulerChoice = Enum("SchedulerChoice", {s: s for s in SCHEDULERS})
+_SCHEDULER_CHOICES: Final[List[Choice]] = [
+    Choice(title=s, value=s) for s in SCHEDULERS
 ]
 
+_WH_RE: Final[re.Pattern] = re.compile(r"^\s*(\d{2,5})\s*[xX]\s*(\d{2,5})\s*$")
+# Same forms int() and float() accept (digit underscores, exponents), minus inf/nan
+_DIGITS: Final[str] = r"\d+(?:_\d+)*"
+_INT_RE: Final[re.Pattern] = re.compile(rf"^[+-]?{_DIGITS}$")
+_FLOAT_RE: Final[re.Pattern] = re.compile(
+    rf"^[+-]?(?:{_DIGITS}(?:\.(?:{_DIGITS})?)?|\.{_DIGITS})(?:[eE][+-]?{_DIGITS})?$"
+)
+
+# civitai's FromTextSchema rejects a width or height outside 1..1024
+MAX_IMAGE_SIDE: Final[int] = 1024
 
+# Fallbacks for seed and clip skip when generate_image is not given them
+_DEFAULT_PARAMS: Final[Dict[str, int]] = {"seed": -1, "clipSkip": 1}
 
 CLIP_SKIP: Final[range] = range(-2, 3)
 IMAGE_SIZES: Dict[str, str] = {
@@ -59,6 +87,19 @@ IMAGE_SIZES: Dict[str, str] = {
     "3:2 - (1536x1024)": "1536x1024",
 }
 
+
+
+def parse_image_size(size: str) -> Optional[Tuple[int, int]]:
+    """Return (width, height) for a WIDTHxHEIGHT string, or None if it is invalid."""
+    match = _WH_RE.match(size)
+    if not match:
+        return None
+    width, height = int(match[1]), int(match[2])
+    if not (1 <= width <= MAX_IMAGE_SIDE and 1 <= height <= MAX_IMAGE_SIDE):
+        return None
+    return width, height
+
+
 class CreateOptions(Enum):
     MODEL = "What model would you like to use? [Required]"
     PROMPT = "Positive Prompt [Required]"
@@ -74,21 +115,38 @@ class CreateOptions(Enum):
 create_group = typer.Typer()
 
 
-def get_lora_details(CIVITAI_MODELS, CIVITAI_VERSIONS,lora_id: int) -> Optional[Dict]:
+def _emit_json(data) -> None:
+    """Serialize data up front and hand the string to rich for highlighting."""
+    console.print_json(json=json_dumps(data).decode())
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_get_model_details(
+    CIVITAI_MODELS: str, CIVITAI_VERSIONS: str, model_id: int, quiet: bool = False
+) -> Dict:
+    """Fetch model details once per run; repeat runs hit the response cache."""
+    return get_model_details(
+        CIVITAI_MODELS, CIVITAI_VERSIONS, model_id, use_cache=True, quiet=quiet
+    )
+
+
+def get_lora_details(
+    CIVITAI_MODELS, CIVITAI_VERSIONS, lora_id: int
+) -> Tuple[Optional[Dict], Optional[str]]:
+    """Return (lora_data, None), or (None, reason) if it is not a usable LoRA."""
+    # Catch swapped arguments before they cost a request or poison the cache
+    if isinstance(lora_id, bool) or not isinstance(lora_id, int):
+        raise TypeError(f"LoRA ID must be an integer, got {type(lora_id).__name__}")
     try:
-        lora_data = get_model_details(
-            CIVITAI_MODELS, 
-            CIVITAI_VERSIONS,
-            lora_id,
+        # Quiet: this runs in worker threads, and failures go in the summary table
+        lora_data = _cached_get_model_details(
+            CIVITAI_MODELS, CIVITAI_VERSIONS, lora_id, quiet=True
         )
         if lora_data and lora_data.get("type") == "LORA":
-            return lora_data
-        else:
-            feedback_message(f"Model with ID {lora_id} is not a LoRA.", "error")
-            return None
+            return lora_data, None
+        return None, "Not a LoRA" if lora_data else "Not found"
     except Exception as e:
-        feedback_message(f"Error fetching LoRA details: {str(e)}", "error")
-        return None
+        return None, f"Error: {str(e)}"
 
 
 def generate_image(
@@ -102,75 +160,146 @@ def generate_image(
     scheduler: str,
     steps: int,
     cfg_scale: float,
-    seed: int,
-    clip_step: int,
+    seed: Optional[int],
+    clip_step: Optional[int],
     lora_list: List[int] = []
 ):
     """Generate the image using the Civitai SDK."""
+    import civitai
+
     feedback_message("Generating the image...", "info")
     try:
-        input_data = {
-            "model": air,
-            "params": {
-                "prompt": pos_prompt,
-                "negativePrompt": neg_prompt,
-                "scheduler": scheduler,
-                "steps": steps,
-                "cfgScale": cfg_scale,
-                "width": width,
-                "height": height,
-                "seed": -1,
-                "clipSkip": 1
-            },
+        params = _DEFAULT_PARAMS | {
+            "prompt": pos_prompt,
+            "negativePrompt": neg_prompt,
+            "scheduler": scheduler,
+            "steps": steps,
+            "cfgScale": cfg_scale,
+            "width": width,
+            "height": height,
         }
+        if seed is not None:
+            params["seed"] = seed
+        if clip_step is not None:
+            params["clipSkip"] = clip_step
+        input_data = {"model": air, "params": params}
 
         if lora_list:
-            input_data["additionalNetworks"] = {}
             feedback_message(f"Processing {len(lora_list)} LoRA models...", "info")
+            lora_map = {
+                lora_id: lora_data
+                for lora_id, lora_data in get_models_bulk(
+                    CIVITAI_MODELS, CIVITAI_VERSIONS, lora_list
+                ).items()
+                if lora_data.get("type") == "LORA"
+            }
+
+            # Version IDs and anything the bulk query missed are looked up one by one
+            missing = [lora_id for lora_id in lora_list if lora_id not in lora_map]
+            lora_failures: Dict[int, str] = {}
+            if missing:
+                with ThreadPoolExecutor(
+                    max_workers=min(LORA_FETCH_WORKERS, len(missing))
+                ) as executor:
+                    results = executor.map(
+                        lambda lora_id: get_lora_details(
+                            CIVITAI_MODELS, CIVITAI_VERSIONS, lora_id
+                        ),
+                        missing,
+                    )
+                    for lora_id, (lora_data, reason) in zip(missing, results):
+                        if lora_data:
+                            lora_map[lora_id] = lora_data
+                        else:
+                            lora_failures[lora_id] = reason
+
+            lora_airs = {
+                lora_id: lora_map[lora_id]["versions"][0].get("air")
+                for lora_id in lora_list
+                if lora_map.get(lora_id) and lora_map[lora_id].get("versions")
+            }
+            input_data["additionalNetworks"] = {
+                lora_air: {"type": "Lora", "strength": 1.0}
+                for lora_air in lora_airs.values()
+                if lora_air
+            }
+
+            lora_table = create_table(
+                "LoRA Models",
+                [("Status", "bright_yellow"), ("LoRA ID", "cyan"), ("AIR", "white")],
+            )
             for lora_id in lora_list:
-                lora_data = get_lora_details(lora_id, CIVITAI_MODELS, CIVITAI_VERSIONS)
-                if lora_data and 'versions' in lora_data and lora_data['versions']:
-                    lora_air = lora_data["versions"][0].get("air")
-                    if lora_air:
-                        input_data["additionalNetworks"][lora_air] = {
-                            "type": "Lora",
-                            "strength": 1.0,
-                        }
-                        feedback_message(f"Added LoRA: {lora_air}", "info")
-                    else:
-                        feedback_message(f"LoRA AIR not found for ID: {lora_id}", "warning")
+                if lora_id in lora_failures:
+                    lora_table.add_row(lora_failures[lora_id], str(lora_id), "")
+                elif lora_id not in lora_airs:
+                    lora_table.add_row("No versions", str(lora_id), "")
+                elif lora_airs[lora_id]:
+                    lora_table.add_row("Added", str(lora_id), lora_airs[lora_id])
                 else:
-                    feedback_message(f"Failed to get details for LoRA ID: {lora_id}", "warning")
+                    lora_table.add_row("AIR not found", str(lora_id), "")
+            console.print(lora_table)
 
         feedback_message("Submitting image generation request...", "info")
         console.print("Input data:", style="bold")
-        print_json(data=input_data)
+        _emit_json(input_data)
 
         response = civitai.image.create(input_data)
-        feedback_message("Image generation request submitted successfully.", "success")
+        feedback_message("Image generation request submitted successfully.", "info")
         return response
     except Exception as e:
         feedback_message(f"Error generating image: {str(e)}", "error")
         return None
 
 
-def fetch_job_details(job_id: str, user_id: str, detailed: bool) -> None:
+def _job_to_dict(job) -> Dict:
+    return job.model_dump() if hasattr(job, "model_dump") else job.dict()
+
+
+def _iter_job_pages(civitai, user_id: str, detailed: bool) -> Iterator[List[Dict]]:
+    """
+    Yield a user's jobs one page at a time.
+
+    The query body accepts a cursor and the QueryJobsResult carries the next
+    one alongside the page's jobs; the page size is chosen by the API. The SDK
+    posts the body as-is, so it must be a plain dict.
+    """
+    cursor = None
+    while True:
+        query = {"properties": {"userId": user_id}}
+        if cursor:
+            query["cursor"] = cursor
+        result = civitai.jobs.query(query, detailed=detailed)
+        jobs = [_job_to_dict(job) for job in (result.jobs or []) if job]
+        if jobs:
+            yield jobs
+
+        if not jobs or not result.cursor or result.cursor == cursor:
+            return
+        cursor = result.cursor
+
+
+def fetch_job_details(
+    job_id: Optional[str] = None, user_id: Optional[str] = None, detailed: bool = False
+) -> None:
+    import civitai
 
     try:
         if job_id:
-            job_details = civitai.jobs.get(id=job_id)
+            job_details = civitai.jobs.get(job_id=job_id)
             if job_details:
                 console.print("Job details:", style="bold")
-                print_json(data=job_details)
+                _emit_json(job_details)
             else:
                 feedback_message("No job details found.", "warning")
         elif user_id:
-            query = {"properties": {"userId": user_id}}
-            jobs = civitai.jobs.query(detailed=detailed, query_jobs_request=query)
-            if jobs:
-                console.print("Jobs:", style="bold")
-                print_json(data=jobs)
-            else:
+            found_jobs = False
+            with console.status("Fetching jobs..."):
+                for page in _iter_job_pages(civitai, user_id, detailed):
+                    if not found_jobs:
+                        console.print("Jobs:", style="bold")
+                        found_jobs = True
+                    _emit_json(page)
+            if not found_jobs:
                 feedback_message("No jobs found for the given user ID.", "warning")
         else:
             feedback_message("Please provide either a job ID or a user ID.", "error")
@@ -180,11 +309,13 @@ def fetch_job_details(job_id: str, user_id: str, detailed: bool) -> None:
 
 def cancel_job(job_id: str):
     """Cancel a job by its Job ID."""
+    import civitai
+
     try:
         response = civitai.jobs.cancel(job_id)
         if response:
             console.print("Job cancellation response:", style="bold")
-            print_json(data=response)
+            _emit_json(response)
         else:
             feedback_message("Failed to cancel the job.", "error")
     except Exception as e:
@@ -196,15 +327,29 @@ def create_image_cli(
     CIVITAI_VERSIONS: str,
     requested_model: int,
     lora_list: List[int],
+    scheduler: Optional[str] = None,
+    steps: Optional[int] = None,
+    cfg_scale: Optional[float] = None,
+    size: Optional[str] = None,
 ) -> None:
+    """
+    Interactively gather generation parameters and submit an image job.
+
+    Any of scheduler, steps, cfg_scale or size passed in skips its prompt.
+    """
     try:
-        raw_model = get_model_details(CIVITAI_MODELS, CIVITAI_VERSIONS, requested_model)
-        processed_model = process_model_data(raw_model)
-        if not processed_model:
+        # get_model_details already returns processed data with per-version AIRs
+        selected_model = _cached_get_model_details(
+            CIVITAI_MODELS, CIVITAI_VERSIONS, requested_model
+        )
+        if not selected_model:
             feedback_message(f"No model found with ID: {requested_model}", "error")
             return
-
-        selected_model = processed_model if processed_model["versions"] else raw_model
+        if not selected_model["versions"]:
+            feedback_message(
+                f"No versions available for model ID: {requested_model}", "error"
+            )
+            return
 
         # Select version if multiple versions exist
         if len(selected_model["versions"]) > 1:
@@ -238,38 +383,55 @@ def create_image_cli(
 
         neg_prompt = prompt("Enter negative prompt (optional):").ask()
 
-        # Select width and height from predefined options
-        width_height = select(
-            "Select width x height:",
-            choices=list(IMAGE_SIZES.keys()),
-        ).ask()
-
-        if not width_height:
-            feedback_message("Width x Height selection is required.", "error")
-            return
+        if size is None:
+            # Select width and height from predefined options
+            width_height = select(
+                "Select width x height:",
+                choices=list(IMAGE_SIZES.keys()),
+            ).ask()
 
-        # Get the corresponding value from IMAGE_SIZES
-        width_height_value = IMAGE_SIZES[width_height]
-        width, height = map(int, width_height_value.split("x"))
+            if not width_height:
+                feedback_message("Width x Height selection is required.", "error")
+                return
 
-        scheduler = select("Select scheduler:", choices=SCHEDULERS).ask()
+            # Get the corresponding value from IMAGE_SIZES
+            size = IMAGE_SIZES[width_height]
 
-        steps = prompt("Enter number of steps:").ask()
-        try:
-            steps = int(steps)
-        except ValueError:
+        parsed_size = parse_image_size(size)
+        if not parsed_size:
             feedback_message(
-                "Invalid number of steps. Please enter an integer.", "error"
+                f"Invalid image size: {size}. Use WIDTHxHEIGHT with sides up to "
+                f"{MAX_IMAGE_SIDE}, e.g. 1024x1024.",
+                "error",
             )
             return
+        width, height = parsed_size
 
-        cfg_scale = prompt("Enter CFG scale:").ask()
-        try:
-            cfg_scale = float(cfg_scale)
-        except ValueError:
-            feedback_message("Invalid CFG scale. Please enter a number.", "error")
+        if scheduler is None:
+            scheduler = select("Select scheduler:", choices=_SCHEDULER_CHOICES).ask()
+        if scheduler not in SCHEDULERS_SET:
+            feedback_message("Scheduler selection is required.", "error")
             return
 
+        if steps is None:
+            steps_input = (prompt("Enter number of steps:").ask() or "").strip()
+            if not _INT_RE.match(steps_input) or int(steps_input) < 1:
+                feedback_message(
+                    "Invalid number of steps. Please enter a positive integer.",
+                    "error",
+                )
+                return
+            steps = int(steps_input)
+
+        if cfg_scale is None:
+            cfg_scale_input = (prompt("Enter CFG scale:").ask() or "").strip()
+            if not _FLOAT_RE.match(cfg_scale_input) or float(cfg_scale_input) < 0:
+                feedback_message(
+                    "Invalid CFG scale. Please enter a non-negative number.", "error"
+                )
+                return
+            cfg_scale = float(cfg_scale_input)
+
         # Ask for seed
         use_random_seed = select(
             "Do you want to use a random seed or enter one?",
@@ -280,25 +442,23 @@ def create_image_cli(
             seed = random.randint(0, 2**32 - 1)
             feedback_message(f"Using random seed: {seed}", "info")
         else:
-            seed_input = prompt("Enter seed:").ask()
-            try:
-                seed = int(seed_input)
-            except ValueError:
+            seed_input = (prompt("Enter seed:").ask() or "").strip()
+            if not _INT_RE.match(seed_input):
                 feedback_message("Invalid seed. Please enter an integer.", "error")
                 return
+            seed = int(seed_input)
 
         # Ask for clip skip
-        clip_skip_input = prompt("Enter clip skip value (-2 to 2):", default="1").ask()
-        try:
-            clip_skip = int(clip_skip_input)
-            if clip_skip not in CLIP_SKIP:
-                raise ValueError
-        except ValueError:
+        clip_skip_input = (
+            prompt("Enter clip skip value (-2 to 2):", default="1").ask() or ""
+        ).strip()
+        if not _INT_RE.match(clip_skip_input) or int(clip_skip_input) not in CLIP_SKIP:
             feedback_message(
                 "Invalid clip skip value. Please enter an integer between -2 and 2.",
                 "error",
             )
             return
+        clip_skip = int(clip_skip_input)
 
         # Generate image
         response = generate_image(
@@ -317,21 +477,22 @@ def create_image_cli(
             lora_list,
         )
 
-        # Check if the response indicates success
-        if response and response.get("success", False):  # Adjust based on actual API response structure
-            console.print("Image generation response:", style="bold")
-            print_json(data=response)
+        if not response:
+            feedback_message("Image generation failed.", "error")
+            return
+
+        console.print("Image generation response:", style="bold")
+        _emit_json(response)
 
-            # Fetch and display job details
+        # civitai.image.create returns {"token", "jobs"}; only fetch job
+        # details when the response carries no job payload of its own
+        if not (response.get("jobs") or response.get("status")):
             if "jobId" in response:
-                job_details = fetch_job_details(response["jobId"])
-                if job_details:
-                    console.print("Job details:", style="bold")
-                    print_json(data=job_details)
+                fetch_job_details(
+                    job_id=response["jobId"], user_id=None, detailed=False
+                )
             else:
                 feedback_message("No job ID found in the response.", "warning")
-        else:
-            feedback_message("Image generation failed.", "error")
 
     except Exception as e:
         feedback_message(f"An unexpected error occurred: {str(e)}", "error")
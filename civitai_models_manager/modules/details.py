@@ -1,10 +1,12 @@
 import httpx
+import typer
 import subprocess
-from typing import Any, Dict, List, Tuple, Optional
+from typing import Any, Dict, Final, List, Tuple, Optional
 import html2text
 import questionary
 import re
 from functools import lru_cache
+from .cache import open_cache, read_cache, write_cache
 from .helpers import feedback_message, create_table, add_rows_to_table
 from .utils import safe_get, safe_url, format_file_size
 from enum import Enum
@@ -19,6 +21,17 @@ __all__ = ["get_model_details_cli"]
 console = Console(soft_wrap=True)
 h2t = html2text.HTML2Text()
 
+# Model pages change (stats, new versions); a given version does not
+MODEL_CACHE_TTL: Final[int] = 60 * 60 * 24
+
+# Shared client so repeated lookups reuse pooled connections and TLS sessions
+HTTP_CLIENT: Final[httpx.Client] = httpx.Client(
+    transport=httpx.HTTPTransport(
+        retries=3,
+        limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+    )
+)
+
 
 class DetailActions(Enum):
     LOOK_IMAGES = "Look up Images for the Model"
@@ -31,8 +44,8 @@ class DetailActions(Enum):
 
 
 # @lru_cache(maxsize=128)
-def fetch_model_data(url: str, model_id: int) -> Optional[Dict]:
-    data = make_request(f"{url}/{model_id}")
+def fetch_model_data(url: str, model_id: int, quiet: bool = False) -> Optional[Dict]:
+    data = make_request(f"{url}/{model_id}", quiet=quiet)
     if data and "modelVersions" in data:
         # Ensure we have the urn:air for at least the first version
         first_version = data["modelVersions"][0] if data["modelVersions"] else {}
@@ -43,11 +56,13 @@ def fetch_model_data(url: str, model_id: int) -> Optional[Dict]:
 
 # @lru_cache(maxsize=128)
 def fetch_version_data(
-    versions_url: str, models_url: str, model_id: int
+    versions_url: str, models_url: str, model_id: int, quiet: bool = False
 ) -> Optional[Dict]:
-    version_data = make_request(f"{versions_url}/{model_id}")
+    version_data = make_request(f"{versions_url}/{model_id}", quiet=quiet)
     if version_data:
-        parent_model_data = make_request(f"{models_url}/{version_data.get('modelId')}")
+        parent_model_data = make_request(
+            f"{models_url}/{version_data.get('modelId')}", quiet=quiet
+        )
         if parent_model_data:
             combined_data = {**version_data, **parent_model_data}
             if "air" not in combined_data:
@@ -58,9 +73,10 @@ def fetch_version_data(
     return None
 
 
-def make_request(url: str) -> Optional[Dict]:
+def make_request(url: str, quiet: bool = False) -> Optional[Dict]:
+    """GET url as JSON; on failure print an error panel unless quiet, and return None."""
     try:
-        response = httpx.get(url)
+        response = HTTP_CLIENT.get(url)
         if response.status_code == 404:
             # TODO: Write a check for model versions that return 404 since civitai only gives pages to parent models and not versions
             pass
@@ -68,20 +84,136 @@ def make_request(url: str) -> Optional[Dict]:
             response.raise_for_status()
         return response.json()
     except httpx.RequestError as e:
-        feedback_message(f"Failed to get data from {url}: {e}", "error")
+        if not quiet:
+            feedback_message(f"Failed to get data from {url}: {e}", "error")
         return None
 
 
+def model_cache_key(CIVITAI_MODELS: str, model_id: int) -> str:
+    return f"model:{CIVITAI_MODELS}/{model_id}"
+
+
+def version_cache_key(CIVITAI_VERSIONS: str, model_id: int) -> str:
+    return f"version:{CIVITAI_VERSIONS}/{model_id}"
+
+
+def fetch_model_or_version_cached(
+    CIVITAI_MODELS: str, CIVITAI_VERSIONS: str, model_id: int, quiet: bool = False
+) -> Optional[Dict]:
+    model_key = model_cache_key(CIVITAI_MODELS, model_id)
+    version_key = version_cache_key(CIVITAI_VERSIONS, model_id)
+    with open_cache() as conn:
+        cached = read_cache(conn, model_key, MODEL_CACHE_TTL) or read_cache(
+            conn, version_key
+        )
+        if cached:
+            return cached
+
+        model_data = fetch_model_data(CIVITAI_MODELS, model_id, quiet=quiet)
+        if model_data is None:
+            # The request itself failed; serve a stale model entry rather than
+            # guessing that the ID belongs to a version
+            return read_cache(conn, model_key)
+        if "error" not in model_data:
+            write_cache(conn, model_key, model_data)
+            return model_data
+
+        # Only an explicit "not found" from the models endpoint means the ID
+        # may be a version ID
+        version_data = fetch_version_data(
+            CIVITAI_VERSIONS, CIVITAI_MODELS, model_id, quiet=quiet
+        )
+        if version_data:
+            write_cache(conn, version_key, version_data)
+        return version_data
+
+
+def fetch_models_bulk(CIVITAI_MODELS: str, ids: List[int]) -> List[Dict]:
+    """
+    Fetch several raw models in a single request.
+
+    IDs the endpoint does not return (e.g. version IDs) are simply absent, and
+    an empty list is returned if the request fails.
+    """
+    if not ids:
+        return []
+
+    params = [("ids", model_id) for model_id in ids]
+    params.append(("limit", min(len(ids), 100)))
+    try:
+        response = HTTP_CLIENT.get(CIVITAI_MODELS, params=params)
+        response.raise_for_status()
+        items = response.json().get("items", [])
+    except (httpx.HTTPError, ValueError):
+        return []
+
+    return [item for item in items if item.get("id") in ids]
+
+
+def get_models_bulk(
+    CIVITAI_MODELS: str, CIVITAI_VERSIONS: str, ids: List[int]
+) -> Dict[int, Dict[str, Any]]:
+    """
+    Get several processed models keyed by model ID, using the response cache.
+
+    Only IDs missing from the cache are sent to the API, in one request, and
+    the raw items it returns are cached. IDs the models endpoint has already
+    reported as not found, and that were then cached as versions, are not
+    requested. Anything absent from the result should be looked up with
+    get_model_details.
+    """
+    unique_ids = list(dict.fromkeys(ids))
+    raw_models: Dict[int, Dict] = {}
+    with open_cache() as conn:
+        misses = []
+        for model_id in unique_ids:
+            cached = read_cache(
+                conn, model_cache_key(CIVITAI_MODELS, model_id), MODEL_CACHE_TTL
+            )
+            if cached:
+                raw_models[model_id] = cached
+            elif not read_cache(conn, version_cache_key(CIVITAI_VERSIONS, model_id)):
+                misses.append(model_id)
+
+        for item in fetch_models_bulk(CIVITAI_MODELS, misses):
+            write_cache(conn, model_cache_key(CIVITAI_MODELS, item["id"]), item)
+            raw_models[item["id"]] = item
+
+    return {
+        model_id: process_model_data(model_data)
+        for model_id, model_data in raw_models.items()
+    }
+
+
 def get_model_details(
-    CIVITAI_MODELS: str, CIVITAI_VERSIONS: str, model_id: int
+    CIVITAI_MODELS: str,
+    CIVITAI_VERSIONS: str,
+    model_id: int,
+    use_cache: bool = False,
+    quiet: bool = False,
 ) -> Dict[str, Any]:
+    """
+    Fetch and process a model, falling back to the versions endpoint.
+
+    With use_cache the responses come from the local response cache
+    (see cache.py); otherwise the API is always queried. With quiet no error
+    panels are printed, for callers that report failures themselves.
+    """
     if not model_id:
-        feedback_message("Please provide a valid model ID.", "error")
+        if not quiet:
+            feedback_message("Please provide a valid model ID.", "error")
         return {}
 
-    model_data = fetch_model_data(CIVITAI_MODELS, model_id)
-    if "error" in model_data:
-        model_data = fetch_version_data(CIVITAI_VERSIONS, CIVITAI_MODELS, model_id)
+    if use_cache:
+        model_data = fetch_model_or_version_cached(
+            CIVITAI_MODELS, CIVITAI_VERSIONS, model_id, quiet=quiet
+        )
+    else:
+        model_data = fetch_model_data(CIVITAI_MODELS, model_id, quiet=quiet)
+        if model_data and "error" in model_data:
+            model_data = fetch_version_data(
+                CIVITAI_VERSIONS, CIVITAI_MODELS, model_id, quiet=quiet
+            )
 
     return process_model_data(model_data) if model_data else {}
 
@@ -375,5 +507,6 @@ def get_model_details_cli(
             print_model_details(model_details, desc, images)
         else:
             feedback_message(f"No model found with ID: {identifier}", "error")
+            raise typer.Exit(code=1)
     except ValueError:
         feedback_message("Invalid model ID. Please enter a valid number.", "error")
@@ -1,4 +1,5 @@
 import os
+import json
 import typer
 
 from typing import Any, Dict
@@ -7,10 +8,29 @@ from rich.table import Table
 from rich.markdown import Markdown
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 
 console = Console()
 
 
+def json_dumps(data: Any) -> bytes:
+    """Serialize data to JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, default=str)
+    return json.dumps(data, default=str).encode()
+
+
+def json_loads(payload: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
 def feedback_message(message: str, type: str = "info") -> None:
     """
     Display a feedback message with appropriate styling based on the message type.
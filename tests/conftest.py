@@ -0,0 +1,8 @@
+import pytest
+from civitai_models_manager.modules import cache
+
+
+@pytest.fixture(autouse=True)
+def cache_db(tmp_path, monkeypatch):
+    """Keep every test's response cache in a throwaway database."""
+    monkeypatch.setattr(cache, "CACHE_DB", tmp_path / "cache.db")
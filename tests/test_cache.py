@@ -0,0 +1,83 @@
+from civitai_models_manager.modules import cache
+
+
+def counting_fetcher(*results):
+    calls = []
+
+    def fetcher():
+        calls.append(None)
+        return results[len(calls) - 1]
+
+    return fetcher, calls
+
+
+def read(key, ttl=None):
+    with cache.open_cache() as conn:
+        return cache.read_cache(conn, key, ttl)
+
+
+def write(key, data):
+    with cache.open_cache() as conn:
+        cache.write_cache(conn, key, data)
+
+
+def age_entry(key, seconds):
+    with cache.open_cache() as conn:
+        conn.execute(
+            "UPDATE responses SET fetched_at = fetched_at - ? WHERE key = ?",
+            (seconds, key),
+        )
+
+
+def test_cached_fetch_hit_skips_fetcher():
+    fetcher, calls = counting_fetcher({"id": 1}, {"id": 2})
+    assert cache.cached_fetch("model:1", 60, fetcher) == {"id": 1}
+    assert cache.cached_fetch("model:1", 60, fetcher) == {"id": 1}
+    assert len(calls) == 1
+
+
+def test_cached_fetch_refetches_expired_entry():
+    fetcher, calls = counting_fetcher({"id": 1}, {"id": 2})
+    cache.cached_fetch("model:1", 60, fetcher)
+    age_entry("model:1", 120)
+    assert cache.cached_fetch("model:1", 60, fetcher) == {"id": 2}
+    assert len(calls) == 2
+
+
+def test_cached_fetch_keeps_stale_entry_when_fetcher_is_falsy():
+    fetcher, calls = counting_fetcher({"id": 1}, None, {"id": 3})
+    cache.cached_fetch("model:1", 60, fetcher)
+    age_entry("model:1", 120)
+    assert cache.cached_fetch("model:1", 60, fetcher) == {"id": 1}
+    # The failed refresh did not overwrite the stale entry
+    assert read("model:1") == {"id": 1}
+    assert cache.cached_fetch("model:1", 60, fetcher) == {"id": 3}
+
+
+def test_cached_fetch_does_not_store_falsy_results():
+    fetcher, calls = counting_fetcher(None, {"id": 1})
+    assert cache.cached_fetch("model:1", 60, fetcher) is None
+    assert cache.cached_fetch("model:1", 60, fetcher) == {"id": 1}
+    assert len(calls) == 2
+
+
+def test_entries_without_ttl_never_expire():
+    fetcher, calls = counting_fetcher({"id": 1}, {"id": 2})
+    cache.cached_fetch("version:1", None, fetcher)
+    age_entry("version:1", 10**9)
+    assert cache.cached_fetch("version:1", None, fetcher) == {"id": 1}
+    assert read("version:1") == {"id": 1}
+    assert len(calls) == 1
+
+
+def test_read_cache_respects_ttl():
+    write("model:1", {"id": 1})
+    assert read("model:1", 60) == {"id": 1}
+    age_entry("model:1", 120)
+    assert read("model:1", 60) is None
+    assert read("missing") is None
+
+
+def test_unopenable_cache_behaves_as_a_miss():
+    assert cache.read_cache(None, "model:1") is None
+    cache.write_cache(None, "model:1", {"id": 1})
@@ -0,0 +1,211 @@
+import json
+import pytest
+from civitai_models_manager.modules import create
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("1024x1024", (1024, 1024)),
+        (" 832 X 1216 ", (832, 1216)),
+        ("1024", None),
+        ("1024x", None),
+        ("8x8", None),
+        ("axb", None),
+    ],
+)
+def test_width_height_regex(value, expected):
+    match = create._WH_RE.match(value)
+    parsed = (int(match[1]), int(match[2])) if match else None
+    assert parsed == expected
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("1024x768", (1024, 768)),
+        ("1024x1536", None),
+        ("2048x2048", None),
+        ("00x512", None),
+        ("axb", None),
+    ],
+)
+def test_parse_image_size_enforces_sdk_limit(value, expected):
+    assert create.parse_image_size(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value, matches",
+    [
+        ("30", True),
+        ("-2", True),
+        ("+7", True),
+        ("1_000", True),
+        ("", False),
+        ("1.5", False),
+        ("1e3", False),
+        ("1__0", False),
+        ("_1", False),
+        ("abc", False),
+    ],
+)
+def test_int_regex(value, matches):
+    assert bool(create._INT_RE.match(value)) is matches
+    if matches:
+        int(value)
+
+
+@pytest.mark.parametrize(
+    "value, matches",
+    [
+        ("7", True),
+        ("7.5", True),
+        (".5", True),
+        ("7.", True),
+        ("+7", True),
+        ("-0.5", True),
+        ("1e1", True),
+        ("2.5E-3", True),
+        ("1_0", True),
+        ("1_000.5", True),
+        ("", False),
+        (".", False),
+        ("1e", False),
+        ("1_.5", False),
+        ("inf", False),
+        ("abc", False),
+    ],
+)
+def test_float_regex(value, matches):
+    assert bool(create._FLOAT_RE.match(value)) is matches
+    if matches:
+        float(value)
+
+
+class FakeJob:
+    def __init__(self, job_id):
+        self.job_id = job_id
+
+    def model_dump(self):
+        return {"jobId": self.job_id}
+
+
+class FakeJobs:
+    def __init__(self, pages):
+        self.pages = pages
+        self.queries = []
+
+    def query(self, query, detailed=False):
+        # The SDK hands the body straight to httpx, so it must encode as JSON
+        self.queries.append(json.loads(json.dumps(query)))
+        jobs, cursor = self.pages[len(self.queries) - 1]
+        return type("QueryJobsResult", (), {"jobs": jobs, "cursor": cursor})()
+
+
+@pytest.fixture
+def fake_jobs(monkeypatch):
+    civitai = pytest.importorskip("civitai")
+
+    def install(pages):
+        jobs = FakeJobs(pages)
+        monkeypatch.setattr(civitai, "jobs", jobs)
+        return jobs
+
+    return install
+
+
+def test_fetch_job_details_follows_query_cursor(fake_jobs, capsys):
+    jobs = fake_jobs(
+        [([FakeJob("a"), FakeJob("b")], "page-2"), ([FakeJob("c")], None)]
+    )
+
+    create.fetch_job_details(user_id="user-1")
+
+    assert jobs.queries == [
+        {"properties": {"userId": "user-1"}},
+        {"properties": {"userId": "user-1"}, "cursor": "page-2"},
+    ]
+    output = capsys.readouterr().out
+    assert all(f'"jobId": "{job_id}"' in output for job_id in "abc")
+
+
+def test_fetch_job_details_reports_no_jobs(fake_jobs, capsys):
+    fake_jobs([(None, None)])
+
+    create.fetch_job_details(user_id="user-1")
+
+    assert "No jobs found for the given user ID." in capsys.readouterr().out
+
+
+def test_generate_image_summarises_loras_in_one_table(monkeypatch, capsys):
+    civitai = pytest.importorskip("civitai")
+    lora = {"type": "LORA", "versions": [{"air": "urn:air:sdxl:lora:civitai:1@10"}]}
+    checkpoint = {"type": "Checkpoint", "versions": [{"air": "urn:air:x"}]}
+    submitted = []
+
+    monkeypatch.setattr(create, "get_models_bulk", lambda *args: {1: lora})
+    monkeypatch.setattr(
+        create,
+        "_cached_get_model_details",
+        lambda models, versions, model_id, quiet=False: {2: checkpoint}.get(
+            model_id, {}
+        ),
+    )
+    def fake_create(input_data):
+        submitted.append(input_data)
+        return {"token": "token-1", "jobs": [{"jobId": "job-1"}]}
+
+    monkeypatch.setattr(civitai.image, "create", fake_create)
+
+    response = create.generate_image(
+        "models",
+        "versions",
+        "urn:air:model",
+        "a cat",
+        "",
+        1024,
+        1024,
+        "EulerA",
+        20,
+        7.0,
+        42,
+        2,
+        [1, 2, 3],
+    )
+
+    assert response == {"token": "token-1", "jobs": [{"jobId": "job-1"}]}
+    assert submitted[0]["additionalNetworks"] == {
+        "urn:air:sdxl:lora:civitai:1@10": {"type": "Lora", "strength": 1.0}
+    }
+    assert submitted[0]["params"]["seed"] == 42
+    assert submitted[0]["params"]["clipSkip"] == 2
+    output = capsys.readouterr().out
+    assert "Not a LoRA" in output and "Not found" in output
+    assert "is not a LoRA" not in output
+
+
+def test_generate_image_returns_sdk_response(monkeypatch, capsys):
+    civitai = pytest.importorskip("civitai")
+    sdk_response = {
+        "token": "token-1",
+        "jobs": [{"jobId": "job-1", "cost": 1, "result": None, "scheduled": True}],
+    }
+    monkeypatch.setattr(civitai.image, "create", lambda input_data: sdk_response)
+
+    response = create.generate_image(
+        "models",
+        "versions",
+        "urn:air:sdxl:checkpoint:civitai:1@10",
+        "a cat",
+        "",
+        1024,
+        1024,
+        "EulerA",
+        20,
+        7.0,
+        42,
+        1,
+    )
+
+    assert response == sdk_response
+    assert "Error generating image" not in capsys.readouterr().out
@@ -0,0 +1,91 @@
+import httpx
+
+from civitai_models_manager.modules import cache, details
+
+MODELS = "https://civitai.test/api/v1/models"
+VERSIONS = "https://civitai.test/api/v1/model-versions"
+
+
+def test_get_models_bulk_only_requests_cache_misses(monkeypatch):
+    requested = []
+
+    def fake_fetch_models_bulk(url, ids):
+        requested.append(list(ids))
+        return [{"id": model_id, "type": "LORA"} for model_id in ids if model_id != 3]
+
+    monkeypatch.setattr(details, "fetch_models_bulk", fake_fetch_models_bulk)
+    with cache.open_cache() as conn:
+        cache.write_cache(
+            conn, details.model_cache_key(MODELS, 1), {"id": 1, "type": "LORA"}
+        )
+        cache.write_cache(conn, details.version_cache_key(VERSIONS, 3), {"id": 3})
+
+    models = details.get_models_bulk(MODELS, VERSIONS, [1, 2, 3, 2])
+
+    assert requested == [[2]]
+    assert sorted(models) == [1, 2]
+    with cache.open_cache() as conn:
+        cached = cache.read_cache(conn, details.model_cache_key(MODELS, 2))
+    assert cached == {"id": 2, "type": "LORA"}
+
+    # A second run is served entirely from the cache
+    details.get_models_bulk(MODELS, VERSIONS, [1, 2])
+    assert requested == [[2], []]
+
+
+def stub_endpoints(monkeypatch, model_response, version_response):
+    calls = []
+
+    def fake_fetch_model_data(url, model_id, quiet=False):
+        calls.append("model")
+        return model_response
+
+    def fake_fetch_version_data(versions_url, models_url, model_id, quiet=False):
+        calls.append("version")
+        return version_response
+
+    monkeypatch.setattr(details, "fetch_model_data", fake_fetch_model_data)
+    monkeypatch.setattr(details, "fetch_version_data", fake_fetch_version_data)
+    return calls
+
+
+def test_failed_model_request_does_not_fall_back_to_versions(monkeypatch):
+    calls = stub_endpoints(monkeypatch, None, {"id": 5, "modelId": 9})
+
+    assert details.fetch_model_or_version_cached(MODELS, VERSIONS, 5) is None
+    assert calls == ["model"]
+    with cache.open_cache() as conn:
+        assert cache.read_cache(conn, details.version_cache_key(VERSIONS, 5)) is None
+
+
+def test_model_not_found_resolves_and_caches_the_version(monkeypatch):
+    version = {"id": 5, "modelId": 9}
+    calls = stub_endpoints(monkeypatch, {"error": "No model with id 5"}, version)
+
+    assert details.fetch_model_or_version_cached(MODELS, VERSIONS, 5) == version
+    assert details.fetch_model_or_version_cached(MODELS, VERSIONS, 5) == version
+    assert calls == ["model", "version"]
+
+
+def test_cached_model_is_preferred_over_cached_version(monkeypatch):
+    calls = stub_endpoints(monkeypatch, None, None)
+    with cache.open_cache() as conn:
+        cache.write_cache(conn, details.model_cache_key(MODELS, 5), {"id": 5})
+        cache.write_cache(conn, details.version_cache_key(VERSIONS, 5), {"id": 50})
+
+    assert details.fetch_model_or_version_cached(MODELS, VERSIONS, 5) == {"id": 5}
+    assert calls == []
+
+
+def test_quiet_lookup_prints_no_error_panels(monkeypatch, capsys):
+    def failing_get(url, **kwargs):
+        raise httpx.ConnectError("offline")
+
+    monkeypatch.setattr(details.HTTP_CLIENT, "get", failing_get)
+
+    assert details.get_model_details(MODELS, VERSIONS, 5, quiet=True) == {}
+    assert details.get_model_details(MODELS, VERSIONS, 0, quiet=True) == {}
+    assert capsys.readouterr().out == ""
+
+    details.get_model_details(MODELS, VERSIONS, 5)
+    assert "Failed to get data from" in capsys.readouterr().out
@@ -37,3 +37,26 @@ def test_invalid_command(runner):
     # print(f"Output: {result.stdout}")
     assert result.exit_code == 2
     assert "No such command 'nonexistent-command'." in result.stdout
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        ["--scheduler", "Bogus"],
+        ["--steps", "0"],
+        ["--steps", "-5"],
+        ["--cfg-scale", "-1"],
+        ["--size", "abc"],
+        ["--size", "2048x2048"],
+    ],
+)
+def test_generate_image_rejects_invalid_options(runner, options):
+    result = runner.invoke(civitai_cli, ["generate", "image", "12345", *options])
+    assert result.exit_code == 2
+
+
+def test_generate_image_lists_options(runner):
+    result = runner.invoke(civitai_cli, ["generate", "image", "--help"])
+    assert result.exit_code == 0
+    for option in ("--scheduler", "--steps", "--cfg-scale", "--size", "EulerA"):
+        assert option in result.stdout